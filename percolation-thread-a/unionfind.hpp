@@ -18,19 +18,29 @@
  * @brief UnionFind implements a disjoint set data structure. It supports union
  * and find operations on the sets, together with a count operation that returns
  * the total number of components.
+ * Parent identifiers and sizes are stored as 32-bit integers, half the
+ * footprint of size_t, which limits the capacity to 2^32-1 keys. Each
+ * parent/size pair is interleaved in a single node so that both live on
+ * the same cache line.
  */
 struct UnionFind {
+    /* Set node */
+    struct Node {
+        uint32_t id;                 /* parent identifier of the set */
+        uint32_t sz;                 /* component size of the set */
+    };
+
     /* Member data */
-    std::vector<size_t> m_id;        /* parent identifier of each set */
-    std::vector<size_t> m_sz;        /* component size of each set */
+    std::vector<Node> m_node;        /* parent id and size of each set */
     size_t m_count;                  /* number of disjoint sets */
     size_t m_capacity;               /* total number of vertex keys */
 
     /* Member functions */
     void clear(void);
     size_t size(size_t v) const;
-    size_t find(size_t v) const;
-    bool connected(size_t v, size_t w) const;
+    size_t root(size_t v) const;
+    size_t find(size_t v);
+    bool connected(size_t v, size_t w);
     void join(size_t v, size_t w);
     std::map<size_t, std::vector<size_t>> sets(void);
 
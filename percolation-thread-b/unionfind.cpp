@@ -17,11 +17,13 @@ using namespace atto;
  * @brief Create a union find object with a specified number of sets.
  */
 UnionFind::UnionFind(size_t capacity)
-    : m_id(capacity)
-    , m_sz(capacity)
-    , m_count(capacity)
+    : m_count(capacity)
     , m_capacity(capacity)
 {
+    core_assert(
+        capacity <= std::numeric_limits<uint32_t>::max(),
+        "invalid union find capacity");
+    m_node.resize(capacity);
     clear();
 }
 
@@ -34,8 +36,8 @@ void UnionFind::clear(void)
 {
     m_count = m_capacity;   /* reset number of disjoint sets. */
     for (size_t v = 0; v < m_capacity; ++v) {
-        m_id[v] = v;        /* parent id of the set. */
-        m_sz[v] = 1;        /* with a single element. */
+        m_node[v].id = static_cast<uint32_t>(v);  /* parent id of the set. */
+        m_node[v].sz = 1;                         /* with a single element. */
     }
 }
 
@@ -45,17 +47,33 @@ void UnionFind::clear(void)
  */
 size_t UnionFind::size(size_t v) const
 {
-    return m_sz[find(v)];
+    return m_node[root(v)].sz;
+}
+
+/**
+ * UnionFind::root
+ * @brief Find the component to which v-key belongs to, without modifying
+ * the trees. Safe to call concurrently from multiple threads.
+ */
+size_t UnionFind::root(size_t v) const
+{
+    while (v != m_node[v].id) {
+        v = m_node[v].id;
+    }
+    return v;
 }
 
 /**
  * UnionFind::find
- * @brief Find the component to which v-key belongs to.
+ * @brief Find the component to which v-key belongs to. Use path halving
+ * to point every other node along the path to its grandparent, flattening
+ * the tree in the same single pass used to locate the root.
  */
-size_t UnionFind::find(size_t v) const
+size_t UnionFind::find(size_t v)
 {
-    while (v != m_id[v]) {
-        v = m_id[v];
+    while (v != m_node[v].id) {
+        m_node[v].id = m_node[m_node[v].id].id;
+        v = m_node[v].id;
     }
     return v;
 }
@@ -64,7 +82,7 @@ size_t UnionFind::find(size_t v) const
  * UnionFind::connected
  * @brief Are sets v and w connected by the same root id?
  */
-bool UnionFind::connected(size_t v, size_t w) const
+bool UnionFind::connected(size_t v, size_t w)
 {
     return (find(v) == find(w));
 }
@@ -87,16 +105,15 @@ void UnionFind::join(size_t v, size_t w)
 
     /*
      * Join the smaller set into the larger set to minimize tree depth after
-     * merge operation. If v-set is smaller than w-set, merge v-set and
-     * increment w-size. Otherwise, merge w-set and increment v-size.
+     * merge operation. If v-set is smaller than w-set, swap the roots so that
+     * v-set is always the larger one. Then merge w-set and increment v-size
+     * along a single path, which the compiler can lower to conditional moves.
      */
-    if (m_sz[root_v] < m_sz[root_w]) {
-        m_id[root_v] = root_w;
-        m_sz[root_w] += m_sz[root_v];
-    } else {
-        m_id[root_w] = root_v;
-        m_sz[root_v] += m_sz[root_w];
+    if (m_node[root_v].sz < m_node[root_w].sz) {
+        std::swap(root_v, root_w);
     }
+    m_node[root_w].id = static_cast<uint32_t>(root_v);
+    m_node[root_v].sz += m_node[root_w].sz;
 
     /* Update the number of components. */
     m_count--;
@@ -111,8 +128,28 @@ void UnionFind::join(size_t v, size_t w)
 std::map<size_t, std::vector<size_t>> UnionFind::sets(void)
 {
     std::map<size_t, std::vector<size_t>> components;
+
+    /*
+     * Create one component for each root, in increasing key order, with
+     * its vector reserved to the component size. Record the address of
+     * each component vector against its root identifier.
+     */
+    std::vector<std::vector<size_t> *> members(m_capacity, nullptr);
+    for (size_t v = 0; v < m_capacity; ++v) {
+        if (v == m_node[v].id) {
+            auto it = components.emplace_hint(
+                components.end(), v, std::vector<size_t>());
+            it->second.reserve(m_node[v].sz);
+            members[v] = &it->second;
+        }
+    }
+
+    /*
+     * Append each set to the component of its root, without searching
+     * the map or growing the component vectors.
+     */
     for (size_t v = 0; v < m_capacity; ++v) {
-        components[find(v)].push_back(v);
+        members[find(v)]->push_back(v);
     }
     return components;
 }